@@ -129,7 +129,7 @@ async def lint_adr(
     try:
         project = await get_project_and_verify_access(project_id, current_user, db)
         service = ADRService(db, project, current_user)
-        result = service.lint_adr(request.file_path)
+        result = service.lint_adr(request.file_path, request.fail_fast)
         return result
     except Exception as e:
         logger.error(f"Failed to lint ADR: {e}")
@@ -166,7 +166,7 @@ async def promote_adr(
             # Commit and push
             if branch:
                 message = f"Add ADR: {slug}"
-                github_service.commit_and_push([final_path], message)
+                await github_service.commit_and_push([final_path], message)
                 
                 # Note: Actual PR creation would require GitHub API
                 pr_url = f"https://github.com/YOUR_ORG/YOUR_REPO/compare/{branch}"
@@ -193,7 +193,11 @@ async def sync_adrs(
     try:
         project = await get_project_and_verify_access(project_id, current_user, db)
         github_service = GitHubService()
-        synced_files, conflicts = github_service.sync_adr_directories(request.direction)
+        synced_files, conflicts = await github_service.sync_adr_directories(request.direction)
+        
+        # Pulled ADRs may carry numbers the project's counter has not reached yet
+        if request.direction in ("pull", "both"):
+            ADRService(db, project, current_user).sync_adr_counter()
         
         return SyncResponse(
             synced_files=synced_files,
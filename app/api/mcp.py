@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 
 from app.schemas.mcp import MCPConfig, MCPFeature, MCPProject, ProposalRequest, ProposalResponse
-from app.services.mcp_client import MCPClient
+from app.services.mcp_client import get_mcp_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/config", response_model=MCPConfig)
 async def get_mcp_config():
     """Get MCP configuration and status."""
-    client = MCPClient()
+    client = get_mcp_client()
     
     connected = False
     if client.is_configured():
@@ -31,7 +31,7 @@ async def get_mcp_config():
 async def get_projects():
     """Get list of projects from MCP."""
     try:
-        client = MCPClient()
+        client = get_mcp_client()
         projects = await client.get_projects()
         return projects
     except Exception as e:
@@ -43,7 +43,7 @@ async def get_projects():
 async def get_features(project: Optional[str] = None):
     """Get list of features from MCP."""
     try:
-        client = MCPClient()
+        client = get_mcp_client()
         features = await client.get_features(project)
         return features
     except Exception as e:
@@ -55,7 +55,7 @@ async def get_features(project: Optional[str] = None):
 async def submit_proposal(request: ProposalRequest):
     """Submit a proposal to MCP."""
     try:
-        client = MCPClient()
+        client = get_mcp_client()
         proposal_id = await client.submit_proposal(
             request.adr_path, request.feature_ids, request.summary, request.patch_content
         )
@@ -44,10 +44,12 @@ class Settings(BaseSettings):
     # MCP Integration (optional - online service)
     mcp_base_url: Optional[str] = None
     mcp_token: Optional[str] = None
+    mcp_cache_ttl: float = 30.0  # Seconds to serve cached projects/features before revalidating
 
     # LLM (optional - online service)
     llm_endpoint: str = "http://localhost:11434/api/generate"
     llm_model: str = "llama2"  # Default model name for LLM endpoint
+    llm_max_concurrency: int = 4  # Maximum LLM requests in flight at once
 
     # Security
     cors_enabled: bool = True
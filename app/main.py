@@ -14,6 +14,8 @@ from app.api import adr, auth, healthz, integrations, mcp, projects
 from app.config import get_settings
 from app.db.database import engine, init_db
 from app.models import base  # noqa: F401 - needed for model registration
+from app.services.llm_service import close_http_client
+from app.services.mcp_client import get_mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Cleanup
     logger.info("Application shutdown")
+    await get_mcp_client().aclose()
+    await close_http_client()
     engine.dispose()
 
 
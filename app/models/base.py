@@ -1,9 +1,9 @@
 """Database models."""
-from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Text, Table
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.db.database import Base
 
@@ -14,7 +14,7 @@ project_members = Table(
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
     Column('role', String, nullable=False, default='member'),  # owner, member, viewer
-    Column('joined_at', DateTime, default=datetime.utcnow)
+    Column('joined_at', DateTime, default=func.now(), server_default=func.now())
 )
 
 
@@ -28,8 +28,10 @@ class User(Base):
     hashed_password = Column(String, nullable=True)  # Optional for API key only users
     api_key = Column(String, unique=True, index=True, nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
     projects = relationship('Project', secondary=project_members, back_populates='members')
@@ -51,8 +53,10 @@ class Project(Base):
     visibility = Column(String, nullable=False, default='private')  # private, public
     project_secret = Column(String, unique=True, index=True, nullable=False)  # For invitations
     owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
 
     # GitHub repository info (optional)
     repo_provider = Column(String, nullable=True)  # github
@@ -80,8 +84,10 @@ class CompilationJob(Base):
     status = Column(String, nullable=False)  # queued, running, completed, failed
     logs = Column(JSON, default=list)
     output_path = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
     error_message = Column(Text, nullable=True)
 
 
@@ -97,8 +103,10 @@ class ADRMetadata(Base):
     slug = Column(String, index=True, nullable=False)
     status = Column(String, nullable=False)  # Draft, Proposed, Accepted, Rejected, Superseded
     author_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
     sha256 = Column(String, nullable=True)
     linked_features = Column(JSON, default=list)  # MCP feature IDs
 
@@ -106,6 +114,15 @@ class ADRMetadata(Base):
     project = relationship('Project', back_populates='adrs')
 
 
+class ADRCounter(Base):
+    """Per-project ADR number counter."""
+
+    __tablename__ = "adr_counters"
+
+    project_id = Column(Integer, ForeignKey('projects.id'), primary_key=True)
+    last_number = Column(Integer, nullable=False, default=0)
+
+
 class ProjectInvitation(Base):
     """Project invitation model."""
 
@@ -119,7 +136,7 @@ class ProjectInvitation(Base):
     token = Column(String, unique=True, index=True, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     accepted_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
 
 class Integration(Base):
@@ -134,7 +151,7 @@ class Integration(Base):
     hooks = Column(JSON, default=list)  # List of hook names
     config = Column(JSON, default=dict)
     enabled = Column(String, nullable=False, default="true")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
 
 class ActionLog(Base):
@@ -148,5 +165,5 @@ class ActionLog(Base):
     job_id = Column(String, index=True, nullable=True)
     action = Column(String, nullable=False)
     details = Column(JSON, default=dict)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, default=func.now(), server_default=func.now())
     sha256 = Column(String, nullable=True)
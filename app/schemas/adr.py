@@ -54,6 +54,7 @@ class LintRequest(BaseModel):
     """Request to lint an ADR."""
 
     file_path: str
+    fail_fast: bool = False
 
 
 class LintResult(BaseModel):
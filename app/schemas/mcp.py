@@ -32,6 +32,18 @@ class MCPFeature(BaseModel):
     metadata: dict[str, Any] = {}
 
 
+class MCPProjectList(BaseModel):
+    """MCP project listing response."""
+
+    projects: list[MCPProject] = []
+
+
+class MCPFeatureList(BaseModel):
+    """MCP feature listing response."""
+
+    features: list[MCPFeature] = []
+
+
 class ProposalRequest(BaseModel):
     """Proposal request."""
 
@@ -6,12 +6,48 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import insert, text, update
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
-from app.models.base import ADRMetadata, ActionLog, CompilationJob, Project, User
+from app.models.base import ADRCounter, ADRMetadata, ActionLog, CompilationJob, Project, User
 from app.schemas.adr import CreateDraftRequest, LintResult
 
+# Markdown headings of level 2 or deeper, captured without the leading hashes.
+_HEADING_RE = re.compile(r"^#{2,}[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+# Lint rules
+_FILENAME_RE = re.compile(r"^\d{3}-.+\.md$")
+_ADR_NUMBER_RE = re.compile(r"^(\d{3})-")
+_STATUS_VALUE_RE = re.compile(r"\s+(\w+)")
+_DRAFT_STATUS_RE = re.compile(r"## Status\s+Draft")
+_DECISION_SECTIONS = ("Decision", "Decision Outcome")
+_REQUIRED_SECTIONS = ("Status", "Context", "Decision", "Consequences", "References")
+_VALID_STATUSES = frozenset({"Draft", "Accepted", "Superseded", "Deprecated"})
+_FILENAME_ERROR = "Filename must match format: NNN-title.md"
+_MISSING_SECTION_ERRORS = {
+    section: f"Missing required section: {section}" for section in _REQUIRED_SECTIONS
+}
+
+# Slug generation
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[-\s]+")
+
+# Seeds the counter on first use; ON CONFLICT covers a concurrent first insert.
+_SEED_ADR_COUNTER = text(
+    "INSERT INTO adr_counters (project_id, last_number) VALUES (:project_id, :last_number) "
+    "ON CONFLICT (project_id) DO UPDATE SET last_number = adr_counters.last_number + :count "
+    "RETURNING last_number"
+)
+
+# Catches the counter up with the ADR directories without ever lowering it.
+_SYNC_ADR_COUNTER = text(
+    "INSERT INTO adr_counters (project_id, last_number) VALUES (:project_id, :last_number) "
+    "ON CONFLICT (project_id) DO UPDATE SET last_number = CASE "
+    "WHEN excluded.last_number > adr_counters.last_number THEN excluded.last_number "
+    "ELSE adr_counters.last_number END"
+)
+
 
 class ADRService:
     """Service for ADR operations."""
@@ -24,95 +60,154 @@ class ADRService:
 
     def create_draft(self, request: CreateDraftRequest) -> tuple[str, str]:
         """Create a new ADR draft."""
-        # Generate slug from title
-        slug = self._generate_slug(request.title)
-        
-        # Get next ADR number for this project
-        number = self._get_next_adr_number()
-        filename = f"{number:03d}-{slug}.md"
-        
-        # Create draft file path (project-specific)
-        draft_path = Path(self.project.draft_path) / filename
-        
-        # Generate MADR content
-        content = self._generate_madr_content(
-            number=number,
-            title=request.title,
-            problem=request.problem,
-            context=request.context,
-            options=request.options,
-            decision_hint=request.decision_hint,
-            references=request.references,
-        )
-        
-        # Write file
-        draft_path.write_text(content)
-        
-        # Calculate SHA256
-        sha256 = self._calculate_sha256(draft_path)
-        
-        # Save metadata
-        metadata = ADRMetadata(
-            project_id=self.project.id,
-            file_path=str(draft_path),
-            title=request.title,
-            slug=filename,
-            status="Draft",
-            author_id=self.user.id,
-            sha256=sha256,
-        )
-        self.db.add(metadata)
-        
-        # Log action
-        log = ActionLog(
-            project_id=self.project.id,
-            user_id=self.user.id,
-            job_id=str(uuid.uuid4()),
-            action="create_draft",
-            details={"title": request.title, "path": str(draft_path)},
-            sha256=sha256,
-        )
-        self.db.add(log)
-        self.db.commit()
-        
-        return str(draft_path), filename
+        return self.create_drafts_batch([request])[0]
+
+    def create_drafts_batch(self, requests: list[CreateDraftRequest]) -> list[tuple[str, str]]:
+        """Create several ADR drafts in a single transaction.
+
+        Numbers are allocated once for the whole batch and the metadata and
+        action-log rows go out as one executemany per table, so importing N
+        ADRs costs one commit instead of N. If an allocated number is already taken on disk,
+        the counter is caught up with the ADR directories and the batch is
+        retried once.
+        """
+        try:
+            return self._write_drafts(requests)
+        except FileExistsError:
+            self.sync_adr_counter()
+            return self._write_drafts(requests)
 
-    def lint_adr(self, file_path: str) -> LintResult:
-        """Lint an ADR file."""
+    def _write_drafts(self, requests: list[CreateDraftRequest]) -> list[tuple[str, str]]:
+        """Write drafts and commit their rows, removing written files if anything fails."""
+        first_number = self._get_next_adr_number(count=len(requests))
+        created = []
+        meta_rows = []
+        log_rows = []
+        written: list[Path] = []
+        
+        try:
+            for offset, request in enumerate(requests):
+                # Generate slug from title
+                slug = self._generate_slug(request.title)
+                number = first_number + offset
+                filename = f"{number:03d}-{slug}.md"
+                
+                # Create draft file path (project-specific)
+                draft_path = Path(self.project.draft_path) / filename
+                
+                # Generate MADR content
+                content = self._generate_madr_content(
+                    number=number,
+                    title=request.title,
+                    problem=request.problem,
+                    context=request.context,
+                    options=request.options,
+                    decision_hint=request.decision_hint,
+                    references=request.references,
+                )
+                
+                # Another ADR may already hold this number under a different slug
+                if self._adr_number_taken(number):
+                    raise FileExistsError(f"ADR number already in use: {number:03d}")
+                
+                # Create the file exclusively so an existing ADR is never overwritten,
+                # and hash the bytes we already hold instead of re-reading it
+                data = content.encode("utf-8")
+                with draft_path.open("xb") as f:
+                    written.append(draft_path)
+                    f.write(data)
+                sha256 = hashlib.sha256(data).hexdigest()
+                
+                # Save metadata
+                meta_rows.append(
+                    {
+                        "project_id": self.project.id,
+                        "file_path": str(draft_path),
+                        "title": request.title,
+                        "slug": filename,
+                        "status": "Draft",
+                        "author_id": self.user.id,
+                        "sha256": sha256,
+                    }
+                )
+                
+                # Log action
+                log_rows.append(
+                    {
+                        "project_id": self.project.id,
+                        "user_id": self.user.id,
+                        "job_id": str(uuid.uuid4()),
+                        "action": "create_draft",
+                        "details": {"title": request.title, "path": str(draft_path)},
+                        "sha256": sha256,
+                    }
+                )
+                created.append((str(draft_path), filename))
+            
+            # The generated ids are never needed, so each table gets one executemany
+            self.db.execute(insert(ADRMetadata), meta_rows)
+            self.db.execute(insert(ActionLog), log_rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            for path in written:
+                path.unlink(missing_ok=True)
+            raise
+        
+        return created
+
+    def lint_adr(self, file_path: str, fail_fast: bool = False) -> LintResult:
+        """Lint an ADR file, stopping at the first error when ``fail_fast`` is set."""
         errors = []
         warnings = []
         
         path = Path(file_path)
-        if not path.exists():
+        try:
+            content = path.read_text()
+        except FileNotFoundError:
             errors.append(f"File not found: {file_path}")
             return LintResult(valid=False, errors=errors, warnings=warnings)
         
-        content = path.read_text()
+        return self._lint_content(path, content, fail_fast)
+
+    def _lint_content(self, path: Path, content: str, fail_fast: bool = False) -> LintResult:
+        """Lint ADR content that has already been read from ``path``."""
+        errors = []
+        warnings = []
         
         # Check filename format
-        if not re.match(r"^\d{3}-.+\.md$", path.name):
-            errors.append("Filename must match format: NNN-title.md")
+        if not _FILENAME_RE.match(path.name):
+            errors.append(_FILENAME_ERROR)
+            if fail_fast:
+                return LintResult(valid=False, errors=errors, warnings=warnings)
+        
+        # Split into sections with a single scan of the headings
+        sections = self._split_sections(content)
         
         # Check required MADR sections
-        required_sections = ["Status", "Context", "Decision", "Consequences", "References"]
-        for section in required_sections:
-            if f"## {section}" not in content:
-                errors.append(f"Missing required section: {section}")
+        for section in _REQUIRED_SECTIONS:
+            if self._find_section(sections, section) is None:
+                errors.append(_MISSING_SECTION_ERRORS[section])
+                if fail_fast:
+                    return LintResult(valid=False, errors=errors, warnings=warnings)
         
         # Check status value
-        status_match = re.search(r"## Status\s+(\w+)", content)
+        status_body = self._find_section(sections, "Status")
+        status_match = _STATUS_VALUE_RE.match(status_body) if status_body else None
         if status_match:
             status = status_match.group(1)
-            if status not in ["Draft", "Accepted", "Superseded", "Deprecated"]:
+            if status not in _VALID_STATUSES:
                 errors.append(f"Invalid status: {status}")
         else:
             errors.append("Could not find status value")
         
         # Check decision summary length (if present)
-        decision_match = re.search(r"## Decision\s+(.+?)(?=\n##|\Z)", content, re.DOTALL)
-        if decision_match:
-            decision = decision_match.group(1).strip()
-            first_line = decision.split("\n")[0]
+        decision_body = next(
+            (sections[name] for name in _DECISION_SECTIONS if name in sections), None
+        )
+        if decision_body:
+            # Only the first line matters; partition avoids splitting the whole body
+            first_line = decision_body.lstrip().partition("\n")[0].rstrip()
             if len(first_line) > 280:
                 warnings.append("Decision summary exceeds 280 characters")
         
@@ -121,30 +216,33 @@ class ADRService:
     def promote_adr(self, draft_path: str) -> str:
         """Promote an ADR from draft to final."""
         source = Path(draft_path)
-        if not source.exists():
-            raise FileNotFoundError(f"Draft not found: {draft_path}")
         
-        # Lint first
-        lint_result = self.lint_adr(draft_path)
+        # Read the draft once and lint that content
+        try:
+            content = source.read_text()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Draft not found: {draft_path}") from None
+        lint_result = self._lint_content(source, content)
         if not lint_result.valid:
             raise ValueError(f"ADR failed linting: {lint_result.errors}")
         
         # Move to final directory (project-specific)
         target = Path(self.project.adr_path) / source.name
         
-        # Read content and update status
-        content = source.read_text()
-        content = re.sub(r"## Status\s+Draft", "## Status\n\nAccepted", content)
+        # Update status
+        content = _DRAFT_STATUS_RE.sub("## Status\n\nAccepted", content)
         
-        # Write to final location
-        target.write_text(content)
+        # Write to final location, hashing the bytes once for metadata and log
+        data = content.encode("utf-8")
+        target.write_bytes(data)
+        sha256 = hashlib.sha256(data).hexdigest()
         
         # Update metadata
         metadata = self.db.query(ADRMetadata).filter_by(file_path=str(source)).first()
         if metadata:
             metadata.file_path = str(target)
             metadata.status = "Accepted"
-            metadata.sha256 = self._calculate_sha256(target)
+            metadata.sha256 = sha256
         
         # Log action
         log = ActionLog(
@@ -152,7 +250,7 @@ class ADRService:
             user_id=self.user.id,
             action="promote_adr",
             details={"source": str(source), "target": str(target)},
-            sha256=self._calculate_sha256(target),
+            sha256=sha256,
         )
         self.db.add(log)
         self.db.commit()
@@ -183,15 +281,72 @@ class ADRService:
         """Get compilation job status."""
         return self.db.query(CompilationJob).filter_by(job_id=job_id).first()
 
+    def _split_sections(self, content: str) -> dict[str, str]:
+        """Map each heading (level 2 or deeper) to the text up to the next heading."""
+        sections: dict[str, str] = {}
+        matches = list(_HEADING_RE.finditer(content))
+        for index, match in enumerate(matches):
+            end = matches[index + 1].start() if index + 1 < len(matches) else len(content)
+            sections.setdefault(match.group(1), content[match.end():end])
+        return sections
+
+    def _find_section(self, sections: dict[str, str], name: str) -> Optional[str]:
+        """Return the body of the first section whose heading starts with ``name``."""
+        return next((body for heading, body in sections.items() if heading.startswith(name)), None)
+
     def _generate_slug(self, title: str) -> str:
         """Generate slug from title."""
-        slug = title.lower()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[-\s]+", "-", slug)
-        return slug.strip("-")
+        slug = _SLUG_STRIP_RE.sub("", title.lower())
+        return _SLUG_SEPARATOR_RE.sub("-", slug).strip("-")
+
+    def _get_next_adr_number(self, count: int = 1) -> int:
+        """Reserve the next ``count`` ADR numbers for this project and return the first.
+
+        The counter lives in ``adr_counters`` and is bumped in the caller's
+        transaction, so concurrent drafts never share a number.
+        """
+        stmt = (
+            update(ADRCounter)
+            .where(ADRCounter.project_id == self.project.id)
+            .values(last_number=ADRCounter.last_number + count)
+            .returning(ADRCounter.last_number)
+        )
+        last_number = self.db.execute(stmt).scalar()
+        
+        if last_number is None:
+            # First allocation for this project: seed from files already on disk
+            last_number = self.db.execute(
+                _SEED_ADR_COUNTER,
+                {
+                    "project_id": self.project.id,
+                    "last_number": self._scan_max_adr_number() + count,
+                    "count": count,
+                },
+            ).scalar_one()
+        
+        return last_number - count + 1
+
+    def sync_adr_counter(self) -> None:
+        """Raise the ADR counter to cover ADRs that reached disk outside this service.
+
+        Call after pulling ADRs from a remote or when files were added by hand.
+        """
+        self.db.execute(
+            _SYNC_ADR_COUNTER,
+            {"project_id": self.project.id, "last_number": self._scan_max_adr_number()},
+        )
+        self.db.commit()
+
+    def _adr_number_taken(self, number: int) -> bool:
+        """Check whether any ADR file in this project's directories uses ``number``."""
+        pattern = f"{number:03d}-*.md"
+        return any(
+            next(Path(directory).glob(pattern), None) is not None
+            for directory in (self.project.adr_path, self.project.draft_path)
+        )
 
-    def _get_next_adr_number(self) -> int:
-        """Get next ADR number for this project."""
+    def _scan_max_adr_number(self) -> int:
+        """Find the highest ADR number in this project's directories."""
         # Check both draft and final directories for this project
         all_files = []
         adr_dir = Path(self.project.adr_path)
@@ -204,11 +359,11 @@ class ADRService:
         
         numbers = []
         for file in all_files:
-            match = re.match(r"^(\d{3})-", file.name)
+            match = _ADR_NUMBER_RE.match(file.name)
             if match:
                 numbers.append(int(match.group(1)))
         
-        return max(numbers, default=0) + 1
+        return max(numbers, default=0)
 
     def _generate_madr_content(
         self,
@@ -1,4 +1,5 @@
 """GitHub integration service."""
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -16,11 +17,18 @@ class GitHubService:
     def __init__(self):
         self.settings = get_settings()
         self.repo_path = self.settings.workdir
+        self._repo: Optional[git.Repo] = None
+
+    def _get_repo(self) -> git.Repo:
+        """Open the repository once and reuse the handle."""
+        if self._repo is None:
+            self._repo = git.Repo(self.repo_path)
+        return self._repo
 
     def is_git_repo(self) -> bool:
         """Check if current directory is a git repository."""
         try:
-            git.Repo(self.repo_path)
+            self._get_repo()
             return True
         except git.exc.InvalidGitRepositoryError:
             return False
@@ -32,7 +40,7 @@ class GitHubService:
             return None
         
         try:
-            repo = git.Repo(self.repo_path)
+            repo = self._get_repo()
             branch_name = f"adr/{slug}"
             
             # Create new branch
@@ -44,18 +52,21 @@ class GitHubService:
             logger.error(f"Failed to create branch: {e}")
             return None
 
-    def commit_and_push(self, file_paths: list[str], message: str) -> bool:
-        """Commit and push files."""
+    async def commit_and_push(self, file_paths: list[str], message: str) -> bool:
+        """Commit and push files without blocking the event loop."""
+        return await asyncio.to_thread(self._commit_and_push, file_paths, message)
+
+    def _commit_and_push(self, file_paths: list[str], message: str) -> bool:
+        """Commit and push files (blocking)."""
         if not self.is_git_repo():
             logger.warning("Not a git repository")
             return False
         
         try:
-            repo = git.Repo(self.repo_path)
+            repo = self._get_repo()
             
             # Add files
-            for file_path in file_paths:
-                repo.index.add([file_path])
+            repo.index.add(file_paths)
             
             # Commit
             repo.index.commit(message)
@@ -70,8 +81,12 @@ class GitHubService:
             logger.error(f"Failed to commit/push: {e}")
             return False
 
-    def sync_adr_directories(self, direction: str = "both") -> tuple[list[str], list[str]]:
-        """Sync ADR directories with remote."""
+    async def sync_adr_directories(self, direction: str = "both") -> tuple[list[str], list[str]]:
+        """Sync ADR directories with remote without blocking the event loop."""
+        return await asyncio.to_thread(self._sync_adr_directories, direction)
+
+    def _sync_adr_directories(self, direction: str) -> tuple[list[str], list[str]]:
+        """Sync ADR directories with remote (blocking)."""
         synced_files = []
         conflicts = []
         
@@ -80,7 +95,7 @@ class GitHubService:
             return synced_files, conflicts
         
         try:
-            repo = git.Repo(self.repo_path)
+            repo = self._get_repo()
             
             if direction in ["pull", "both"]:
                 # Pull changes
@@ -94,10 +109,14 @@ class GitHubService:
                 adr_draft_files = list(Path(self.settings.adr_draft_dir).glob("**/*.md"))
                 
                 all_adr_files = adr_files + adr_draft_files
-                for file_path in all_adr_files:
-                    relative_path = file_path.relative_to(self.repo_path)
-                    repo.index.add([str(relative_path)])
-                    synced_files.append(str(relative_path))
+                relative_paths = [
+                    str(file_path.relative_to(self.repo_path)) for file_path in all_adr_files
+                ]
+                
+                # Stage everything in a single index write
+                if relative_paths:
+                    repo.index.add(relative_paths)
+                synced_files.extend(relative_paths)
                 
                 # Commit if there are changes
                 if repo.index.diff("HEAD"):
@@ -0,0 +1,68 @@
+"""Retry helper for outbound HTTP calls to LLM and MCP endpoints."""
+import asyncio
+import logging
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upstream backpressure worth waiting out rather than failing the whole pipeline
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+MAX_ATTEMPTS = 4
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # "-0000" dates parse as naive; RFC 9110 dates are always in UTC
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring Retry-After over exponential backoff."""
+    delay = _parse_retry_after(response.headers.get("Retry-After"))
+    if delay is None:
+        delay = BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, BASE_DELAY)
+    return min(delay, MAX_DELAY)
+
+
+async def send_with_retry(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    stream: bool = False,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> httpx.Response:
+    """Send ``request``, retrying while the upstream answers 429 or 503."""
+    for attempt in range(1, max_attempts):
+        response = await client.send(request, stream=stream)
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return response
+        
+        delay = retry_delay(response, attempt)
+        await response.aclose()
+        logger.warning(
+            f"{request.method} {request.url} returned {response.status_code}, "
+            f"retrying in {delay:.1f}s (attempt {attempt}/{max_attempts})"
+        )
+        await asyncio.sleep(delay)
+    
+    return await client.send(request, stream=stream)
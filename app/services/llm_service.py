@@ -1,6 +1,11 @@
 """LLM service for ADR compilation."""
 import asyncio
+import json
 import logging
+import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -9,9 +14,97 @@ from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.base import CompilationJob
+from app.services.http_retry import send_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; only the draft is substituted per call
+_ADR_PROMPT = """You are an expert in writing Architecture Decision Records (ADRs).
+
+Review and improve the following ADR draft. Focus on:
+1. Clarity and precision
+2. Actionable details
+3. Completeness of sections
+4. Professional tone
+5. Clear decision rationale
+
+Return the improved ADR content maintaining the MADR format.
+
+Draft ADR:
+%s
+
+Improved ADR:"""
+
+# Strong references to background compilations so they are not garbage collected mid-flight
+_background_tasks: set[asyncio.Task[None]] = set()
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Per-endpoint circuit breaker: after repeated failures, skip the endpoint for a cool-off window
+_BREAKER_FAILURE_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+_breakers: dict[str, dict[str, float]] = {}
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent LLM requests."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(get_settings().llm_max_concurrency)
+    return _llm_semaphore
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for LLM requests so keep-alive survives across compilations."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(15.0, connect=2.0, read=30.0),
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30.0),
+        )
+    return _http_client
+
+
+def _circuit_open(endpoint: str) -> bool:
+    """Check whether ``endpoint`` is in its cool-off window after repeated failures."""
+    breaker = _breakers.get(endpoint)
+    return breaker is not None and time.monotonic() < breaker["open_until"]
+
+
+def _record_success(endpoint: str) -> None:
+    """Close the circuit for ``endpoint``."""
+    _breakers.pop(endpoint, None)
+
+
+def _record_failure(endpoint: str) -> None:
+    """Count a failure for ``endpoint``, opening its circuit once the threshold is reached."""
+    breaker = _breakers.setdefault(endpoint, {"failures": 0, "open_until": 0.0})
+    breaker["failures"] += 1
+    if breaker["failures"] >= _BREAKER_FAILURE_THRESHOLD:
+        breaker["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
+        logger.warning(f"LLM endpoint {endpoint} failing, skipping it for {_BREAKER_COOLDOWN:.0f}s")
+
+
+async def close_http_client() -> None:
+    """Close the shared LLM HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a sibling temp file so readers never see a partial draft."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class LLMService:
     """Service for LLM-based ADR compilation."""
@@ -19,118 +112,172 @@ class LLMService:
     def __init__(self, db: Session):
         self.db = db
         self.settings = get_settings()
+        # Bound once; settings do not change for the lifetime of the service
+        self.model = self.settings.llm_model
+        self.endpoint = self.settings.llm_endpoint
+        self.openai_endpoint = self.endpoint.replace("/generate", "/chat/completions")
 
     async def compile_adr(self, job_id: str) -> None:
-        """Compile ADR using LLM (async background task)."""
-        job = self.db.query(CompilationJob).filter_by(job_id=job_id).first()
+        """Compile ADR using LLM (async background task).
+
+        Database and file I/O run in worker threads so the event loop keeps
+        serving other requests while a compilation is in flight.
+        """
+        query = self.db.query(CompilationJob).filter_by(job_id=job_id)
+        job = await asyncio.to_thread(query.first)
         if not job:
             logger.error(f"Job not found: {job_id}")
             return
         
+        # Log lines are buffered and written only with each state transition
+        logs = list(job.logs or [])
+        # Read before committing: the commit expires ``job``, and touching an expired
+        # attribute would reload it with a SELECT on the event loop thread
+        draft_path = Path(job.draft_path)
+        
         try:
             # Update status
             job.status = "running"
-            job.logs.append("Starting compilation...")
-            self.db.commit()
+            logs.append("Starting compilation...")
+            job.logs = list(logs)
+            await asyncio.to_thread(self.db.commit)
             
             # Read draft content
-            draft_path = Path(job.draft_path)
-            if not draft_path.exists():
-                raise FileNotFoundError(f"Draft not found: {job.draft_path}")
-            
-            content = draft_path.read_text()
+            try:
+                content = await asyncio.to_thread(draft_path.read_text)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Draft not found: {draft_path}") from None
             
-            job.logs.append("Sending to LLM...")
-            self.db.commit()
+            logs.append("Sending to LLM...")
             
-            # Send to LLM
-            improved_content = await self._call_llm(content)
+            # Send to LLM, waiting for a slot if too many compilations are running
+            async with _get_llm_semaphore():
+                improved_content = await self._call_llm(content)
             
             if improved_content:
-                job.logs.append("LLM processing complete")
+                logs.append("LLM processing complete")
                 
                 # Write improved content
-                draft_path.write_text(improved_content)
+                await asyncio.to_thread(_write_atomic, draft_path, improved_content.encode("utf-8"))
                 
                 job.status = "completed"
                 job.output_path = str(draft_path)
-                job.logs.append("Draft updated successfully")
+                logs.append("Draft updated successfully")
             else:
                 raise ValueError("LLM returned empty response")
             
-            self.db.commit()
+            job.logs = logs
+            await asyncio.to_thread(self.db.commit)
             
         except Exception as e:
             logger.error(f"Compilation failed for job {job_id}: {e}")
             job.status = "failed"
             job.error_message = str(e)
-            job.logs.append(f"Error: {str(e)}")
-            self.db.commit()
+            logs.append(f"Error: {str(e)}")
+            job.logs = logs
+            await asyncio.to_thread(self.db.commit)
 
     async def _call_llm(self, content: str) -> Optional[str]:
         """Call LLM endpoint with ADR content."""
-        prompt = f"""You are an expert in writing Architecture Decision Records (ADRs).
-        
-Review and improve the following ADR draft. Focus on:
-1. Clarity and precision
-2. Actionable details
-3. Completeness of sections
-4. Professional tone
-5. Clear decision rationale
-
-Return the improved ADR content maintaining the MADR format.
-
-Draft ADR:
-{content}
-
-Improved ADR:"""
+        prompt = _ADR_PROMPT % content
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Try Ollama-style endpoint first
+            client = _get_http_client()
+            
+            # Try Ollama-style endpoint first
+            if not _circuit_open(self.endpoint):
                 try:
-                    response = await client.post(
-                        self.settings.llm_endpoint,
+                    request = client.build_request(
+                        "POST",
+                        self.endpoint,
                         json={
-                            "model": self.settings.llm_model,
+                            "model": self.model,
                             "prompt": prompt,
-                            "stream": False,
+                            "stream": True,
                         },
                     )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        return data.get("response", content)
+                    response = await send_with_retry(client, request, stream=True)
+                    try:
+                        if response.status_code == 200:
+                            improved = await self._read_ollama_stream(response)
+                            _record_success(self.endpoint)
+                            return improved
+                    finally:
+                        await response.aclose()
                 except Exception:
                     pass
-                
-                # Fallback: try OpenAI-compatible endpoint
+                _record_failure(self.endpoint)
+            
+            # Fallback: try OpenAI-compatible endpoint
+            if not _circuit_open(self.openai_endpoint):
                 try:
-                    openai_endpoint = self.settings.llm_endpoint.replace("/generate", "/chat/completions")
-                    response = await client.post(
-                        openai_endpoint,
+                    request = client.build_request(
+                        "POST",
+                        self.openai_endpoint,
                         json={
-                            "model": self.settings.llm_model,
+                            "model": self.model,
                             "messages": [{"role": "user", "content": prompt}],
+                            "stream": True,
                         },
                     )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        return data["choices"][0]["message"]["content"]
+                    response = await send_with_retry(client, request, stream=True)
+                    try:
+                        if response.status_code == 200:
+                            improved = await self._read_openai_stream(response)
+                            _record_success(self.openai_endpoint)
+                            return improved
+                    finally:
+                        await response.aclose()
                 except Exception:
                     pass
-                
-                # If both fail, return original content with a note
-                logger.warning("LLM endpoint not available, returning original content")
-                return content + "\n\n<!-- LLM enhancement unavailable -->\n"
-                
+                _record_failure(self.openai_endpoint)
+            
+            # If both fail, return original content with a note
+            logger.warning("LLM endpoint not available, returning original content")
+            return content + "\n\n<!-- LLM enhancement unavailable -->\n"
+            
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             return None
 
+    async def _read_ollama_stream(self, response: httpx.Response) -> str:
+        """Collect the text of an Ollama NDJSON stream as it arrives."""
+        chunks = []
+        async for line in response.aiter_lines():
+            if line:
+                chunks.append(json.loads(line).get("response", ""))
+        return "".join(chunks)
+
+    async def _read_openai_stream(self, response: httpx.Response) -> str:
+        """Collect the text of an OpenAI-compatible server-sent event stream."""
+        # Some compatible servers ignore "stream" and answer with a single JSON body
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            await response.aread()
+            return response.json()["choices"][0]["message"]["content"]
+        
+        chunks = []
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            delta = json.loads(data)["choices"][0].get("delta", {})
+            chunks.append(delta.get("content") or "")
+        return "".join(chunks)
+
+
+def _on_background_task_done(task: asyncio.Task[None]) -> None:
+    """Release a finished background compilation and log any unexpected failure."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background compilation crashed: {task.exception()}")
+
 
-def start_compilation_background(db: Session, job_id: str) -> None:
+def start_compilation_background(db: Session, job_id: str) -> asyncio.Task[None]:
     """Start compilation in background (helper for sync contexts)."""
     llm_service = LLMService(db)
-    asyncio.create_task(llm_service.compile_adr(job_id))
+    task = asyncio.create_task(llm_service.compile_adr(job_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
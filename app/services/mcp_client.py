@@ -1,14 +1,22 @@
 """MCP client service."""
+import asyncio
+import importlib.util
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Optional
 
 import httpx
 
 from app.config import get_settings
-from app.schemas.mcp import MCPFeature, MCPProject
+from app.schemas.mcp import MCPFeature, MCPFeatureList, MCPProject, MCPProjectList
+from app.services.http_retry import send_with_retry
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets concurrent requests share one connection, but needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class MCPClient:
     """MCP REST client."""
@@ -17,24 +25,82 @@ class MCPClient:
         self.settings = get_settings()
         self.base_url = self.settings.mcp_base_url
         self.token = self.settings.mcp_token
+        self.cache_ttl = self.settings.mcp_cache_ttl
+        self._auth_headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        self._client: Optional[httpx.AsyncClient] = None
+        # Cache key -> (fetched at, ETag, parsed items)
+        self._cache: dict[str, tuple[float, Optional[str], list[Any]]] = {}
 
     def is_configured(self) -> bool:
         """Check if MCP is configured."""
         return self.base_url is not None
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            if self.base_url is None:
+                raise ValueError("MCP not configured")
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._auth_headers,
+                timeout=10.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def invalidate(self) -> None:
+        """Drop cached project and feature listings."""
+        self._cache.clear()
+
+    async def _get_list(
+        self,
+        path: str,
+        params: dict[str, str],
+        envelope: type[MCPProjectList] | type[MCPFeatureList],
+        field: str,
+    ) -> list[Any]:
+        """GET a listing, serving it from cache within the TTL and revalidating via ETag."""
+        cache_key = str(httpx.URL(path, params=params))
+        cached = self._cache.get(cache_key)
+        now = time.monotonic()
+        
+        if cached and now - cached[0] < self.cache_ttl:
+            return list(cached[2])
+        
+        headers = {}
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+        
+        client = self._get_client()
+        request = client.build_request("GET", path, params=params, headers=headers)
+        response = await send_with_retry(client, request)
+        if cached and response.status_code == 304:
+            self._cache[cache_key] = (now, cached[1], cached[2])
+            return list(cached[2])
+        response.raise_for_status()
+        
+        # Validate the raw body straight into models, skipping the intermediate dicts
+        items = getattr(envelope.model_validate_json(response.content), field)
+        self._cache[cache_key] = (now, response.headers.get("ETag"), items)
+        return list(items)
+
     async def test_connection(self) -> bool:
         """Test MCP connection."""
         if not self.is_configured():
             return False
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                headers = {}
-                if self.token:
-                    headers["Authorization"] = f"Bearer {self.token}"
-                
-                response = await client.get(f"{self.base_url}/health", headers=headers)
-                return response.status_code == 200
+            response = await self._get_client().get("/health", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"MCP connection test failed: {e}")
             return False
@@ -45,16 +111,7 @@ class MCPClient:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                headers = {}
-                if self.token:
-                    headers["Authorization"] = f"Bearer {self.token}"
-                
-                response = await client.get(f"{self.base_url}/projects", headers=headers)
-                response.raise_for_status()
-                
-                data = response.json()
-                return [MCPProject(**project) for project in data.get("projects", [])]
+            return await self._get_list("/projects", {}, MCPProjectList, "projects")
         except Exception as e:
             logger.error(f"Failed to get projects from MCP: {e}")
             return []
@@ -65,26 +122,27 @@ class MCPClient:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                headers = {}
-                if self.token:
-                    headers["Authorization"] = f"Bearer {self.token}"
-                
-                params = {}
-                if project_id:
-                    params["project"] = project_id
-                
-                response = await client.get(
-                    f"{self.base_url}/features", headers=headers, params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return [MCPFeature(**feature) for feature in data.get("features", [])]
+            params = {}
+            if project_id:
+                params["project"] = project_id
+            
+            return await self._get_list("/features", params, MCPFeatureList, "features")
         except Exception as e:
             logger.error(f"Failed to get features from MCP: {e}")
             return []
 
+    async def get_features_for_projects(
+        self, project_ids: list[str]
+    ) -> dict[str, list[MCPFeature]]:
+        """Get features for several projects concurrently."""
+        results = await asyncio.gather(*(self.get_features(pid) for pid in project_ids))
+        return dict(zip(project_ids, results))
+
+    async def get_projects_and_features(self) -> tuple[list[MCPProject], list[MCPFeature]]:
+        """Get projects and features concurrently."""
+        projects, features = await asyncio.gather(self.get_projects(), self.get_features())
+        return projects, features
+
     async def submit_proposal(
         self, adr_path: str, feature_ids: list[str], summary: str, patch_content: Optional[str]
     ) -> Optional[str]:
@@ -93,25 +151,26 @@ class MCPClient:
             raise ValueError("MCP not configured")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                headers = {}
-                if self.token:
-                    headers["Authorization"] = f"Bearer {self.token}"
-                
-                payload = {
-                    "adr_path": adr_path,
-                    "feature_ids": feature_ids,
-                    "summary": summary,
-                    "patch_content": patch_content,
-                }
-                
-                response = await client.post(
-                    f"{self.base_url}/proposals", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return data.get("proposal_id")
+            payload = {
+                "adr_path": adr_path,
+                "feature_ids": feature_ids,
+                "summary": summary,
+                "patch_content": patch_content,
+            }
+            
+            client = self._get_client()
+            request = client.build_request("POST", "/proposals", json=payload, timeout=30.0)
+            response = await send_with_retry(client, request)
+            response.raise_for_status()
+            
+            data = response.json()
+            return data.get("proposal_id")
         except Exception as e:
             logger.error(f"Failed to submit proposal to MCP: {e}")
             raise
+
+
+@lru_cache
+def get_mcp_client() -> MCPClient:
+    """Get the shared MCP client so its connection pool is reused across requests."""
+    return MCPClient()
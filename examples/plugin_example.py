@@ -3,8 +3,24 @@
 This demonstrates how external tools can register with ADR-Master
 to enhance ADR generation and agentic workflows.
 """
+import logging
+import re
+
 import httpx
 
+logger = logging.getLogger(__name__)
+
+# Matched as substrings in a single pass over the lowercased draft; the lookahead
+# consumes nothing, so overlapping keywords such as "databasecurity" all match
+_RISK_KEYWORDS_RE = re.compile("(?=(security|database|migration|performance))")
+
+# Risk type -> recommendation, looked up once per identified risk
+_RECOMMENDATIONS = {
+    "security": "Add security review section and consider threat modeling",
+    "data": "Document data migration strategy and rollback plan",
+    "performance": "Add performance impact assessment and monitoring plan",
+}
+
 
 class RiskAnalyzerPlugin:
     """Example plugin that analyzes ADR risks."""
@@ -25,7 +41,7 @@ class RiskAnalyzerPlugin:
                 },
             )
             response.raise_for_status()
-            print("Plugin registered successfully")
+            logger.info("Plugin registered successfully")
 
     def on_draft_create(self, draft_path: str, metadata: dict) -> dict:
         """Hook called when a new draft is created.
@@ -42,14 +58,15 @@ class RiskAnalyzerPlugin:
             content = f.read()
 
         # Perform risk analysis (simplified example)
+        keywords = set(_RISK_KEYWORDS_RE.findall(content.lower()))
         risks = []
 
-        if "security" in content.lower():
+        if "security" in keywords:
             risks.append(
                 {"level": "high", "type": "security", "message": "Security implications mentioned"}
             )
 
-        if "database" in content.lower() and "migration" not in content.lower():
+        if "database" in keywords and "migration" not in keywords:
             risks.append(
                 {
                     "level": "medium",
@@ -58,7 +75,7 @@ class RiskAnalyzerPlugin:
                 }
             )
 
-        if "performance" not in content.lower():
+        if "performance" not in keywords:
             risks.append(
                 {
                     "level": "low",
@@ -92,23 +109,9 @@ class RiskAnalyzerPlugin:
 
     def _generate_recommendations(self, risks: list[dict]) -> list[str]:
         """Generate recommendations based on identified risks."""
-        recommendations = []
-
-        for risk in risks:
-            if risk["type"] == "security":
-                recommendations.append(
-                    "Add security review section and consider threat modeling"
-                )
-            elif risk["type"] == "data":
-                recommendations.append(
-                    "Document data migration strategy and rollback plan"
-                )
-            elif risk["type"] == "performance":
-                recommendations.append(
-                    "Add performance impact assessment and monitoring plan"
-                )
-
-        return recommendations
+        return [
+            _RECOMMENDATIONS[risk["type"]] for risk in risks if risk["type"] in _RECOMMENDATIONS
+        ]
 
 
 # Usage example
@@ -137,4 +140,5 @@ async def main():
 if __name__ == "__main__":
     import asyncio
 
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
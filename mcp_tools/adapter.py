@@ -15,6 +15,33 @@ class ADRToolsAdapter:
     def __init__(self, base_url: str = "http://localhost:8000"):
         """Initialize adapter with ADR-Master API base URL."""
         self.base_url = base_url
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "ADRToolsAdapter":
+        """Enter an ``async with`` block; the client is closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the pooled HTTP client."""
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post(self, path: str, payload: dict[str, Any]) -> httpx.Response:
+        """POST ``payload`` to ``path`` and raise on an error status."""
+        response = await self._get_client().post(path, json=payload)
+        response.raise_for_status()
+        return response
 
     async def adr_generate(
         self, title: str, problem: str, context: str, options: Optional[str] = None
@@ -30,18 +57,16 @@ class ADRToolsAdapter:
         Returns:
             dict with draft_path, slug, and message
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/adr/draft",
-                json={
-                    "title": title,
-                    "problem": problem,
-                    "context": context,
-                    "options": options,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._post(
+            "/api/adr/draft",
+            {
+                "title": title,
+                "problem": problem,
+                "context": context,
+                "options": options,
+            },
+        )
+        return response.json()
 
     async def adr_compile(self, draft_path: str, human_notes: Optional[str] = None) -> dict[str, Any]:
         """Compile an ADR draft using LLM.
@@ -53,13 +78,10 @@ class ADRToolsAdapter:
         Returns:
             dict with job_id and message
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/adr/compile",
-                json={"draft_path": draft_path, "human_notes": human_notes},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._post(
+            "/api/adr/compile", {"draft_path": draft_path, "human_notes": human_notes}
+        )
+        return response.json()
 
     async def adr_lint(self, file_path: str) -> dict[str, Any]:
         """Lint an ADR file.
@@ -70,12 +92,17 @@ class ADRToolsAdapter:
         Returns:
             dict with valid, errors, and warnings
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/adr/lint", json={"file_path": file_path}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._post("/api/adr/lint", {"file_path": file_path})
+        return response.json()
+
+    async def adr_lint_raw(self, file_path: str) -> bytes:
+        """Lint an ADR file, returning the undecoded JSON body.
+
+        For callers that forward the result to another JSON sink (e.g. MCP over
+        stdio) and would otherwise parse and re-serialize it.
+        """
+        response = await self._post("/api/adr/lint", {"file_path": file_path})
+        return response.content
 
     async def adr_promote(self, draft_path: str, create_pr: bool = False) -> dict[str, Any]:
         """Promote an ADR from draft to final.
@@ -87,13 +114,10 @@ class ADRToolsAdapter:
         Returns:
             dict with final_path, branch, pr_url, and message
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/adr/promote",
-                json={"draft_path": draft_path, "create_pr": create_pr},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._post(
+            "/api/adr/promote", {"draft_path": draft_path, "create_pr": create_pr}
+        )
+        return response.json()
 
     async def adr_sync(self, direction: str = "both") -> dict[str, Any]:
         """Sync ADR directories with remote.
@@ -104,12 +128,13 @@ class ADRToolsAdapter:
         Returns:
             dict with synced_files, conflicts, and message
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/adr/sync", json={"direction": direction}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._post("/api/adr/sync", {"direction": direction})
+        return response.json()
+
+    async def adr_sync_raw(self, direction: str = "both") -> bytes:
+        """Sync ADR directories with remote, returning the undecoded JSON body."""
+        response = await self._post("/api/adr/sync", {"direction": direction})
+        return response.content
 
 
 # MCP Tool Definitions
@@ -43,6 +43,9 @@ def tests(session: nox.Session) -> None:
     session.install("-e", ".[dev]")
     session.run(
         "pytest",
+        "-n",
+        "auto",
+        "--dist=loadfile",
         "--cov=app",
         "--cov-report=term-missing",
         "--cov-report=html",
@@ -54,4 +57,4 @@ def tests(session: nox.Session) -> None:
 def tests_no_cov(session: nox.Session) -> None:
     """Run pytest without coverage requirements."""
     session.install("-e", ".[dev]")
-    session.run("pytest", "-v")
+    session.run("pytest", "-v", "-n", "auto", "--dist=loadfile")
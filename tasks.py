@@ -1,5 +1,14 @@
 """Invoke tasks for ADR-Master."""
-from invoke import task
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from invoke import Exit, task
+
+# Independent nox sessions run by ``ci_all``; each has its own .nox/<session> virtualenv
+CI_SESSIONS = ("lint", "type_check", "security", "tests")
 
 
 @task
@@ -40,21 +49,65 @@ def security(c):
 
 
 @task
-def test(c, cov=True):
-    """Run pytest."""
-    if cov:
-        c.run("pytest --cov=app --cov-report=term-missing --cov-report=html")
+def test(c, cov=True, fast=False):
+    """Run pytest; ``--fast`` reruns last failures, then new tests, stopping at the first failure."""
+    if fast:
+        c.run("pytest --lf --nf -x --no-cov")
+    elif cov:
+        c.run(
+            "pytest -n auto --dist=loadfile --cov=app --cov-report=term-missing --cov-report=html"
+        )
     else:
-        c.run("pytest -v")
+        c.run("pytest -v -n auto --dist=loadfile")
+
+
+def _run_nox_session(name: str) -> subprocess.CompletedProcess[str]:
+    """Run one nox session without installing, capturing its combined output."""
+    return subprocess.run(
+        ["nox", "-R", "-s", name], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+
+@task
+def ci_all(c):
+    """Run the nox CI sessions in parallel, printing each session's output as it finishes."""
+    # Install serially first: concurrent first-time editable installs race on the in-tree
+    # build metadata, and the -R runs below skip installs, so stale virtualenvs get new
+    # dependencies here
+    c.run(f"nox --install-only -s {' '.join(CI_SESSIONS)}")
+    
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(CI_SESSIONS)) as pool:
+        futures = {pool.submit(_run_nox_session, name): name for name in CI_SESSIONS}
+        for future in as_completed(futures):
+            name = futures[future]
+            result = future.result()
+            print(f"===== nox -s {name}: exit code {result.returncode} =====")
+            print(result.stdout, end="", flush=True)
+            if result.returncode != 0:
+                failed.append(name)
+    
+    if failed:
+        raise Exit(f"Failed nox sessions: {', '.join(failed)}", code=1)
 
 
 @task
 def clean(c):
     """Remove build artifacts and caches."""
-    c.run("rm -rf build dist *.egg-info")
-    c.run("rm -rf .pytest_cache .mypy_cache .ruff_cache htmlcov")
-    c.run("find . -type d -name __pycache__ -exec rm -rf {} + || true")
-    c.run("find . -type f -name '*.pyc' -delete")
+    root = Path(".")
+    for name in ("build", "dist", ".pytest_cache", ".mypy_cache", ".ruff_cache", "htmlcov"):
+        shutil.rmtree(root / name, ignore_errors=True)
+    for egg_info in root.glob("*.egg-info"):
+        shutil.rmtree(egg_info, ignore_errors=True)
+    
+    # One walk removes __pycache__ directories and stray .pyc files alike
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "__pycache__" in dirnames:
+            dirnames.remove("__pycache__")
+            shutil.rmtree(Path(dirpath, "__pycache__"), ignore_errors=True)
+        for filename in filenames:
+            if filename.endswith(".pyc"):
+                Path(dirpath, filename).unlink(missing_ok=True)
 
 
 @task
@@ -1,16 +1,27 @@
 """Pytest configuration and fixtures."""
+import importlib.util
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.config import Settings, get_settings
 from app.db.database import Base, get_db
 from app.main import app
+from app.models.base import Project, User
+
+# Session served to the app by the shared test client; rebound by the ``client`` fixture.
+# A plain module attribute rather than a ContextVar, since the app runs in the
+# TestClient's portal thread and would not see per-test context changes.
+_client_db: Optional[Session] = None
+
+# Run the test client's event loop on uvloop where it is installed
+_CLIENT_BACKEND_OPTIONS = {"use_uvloop": True} if importlib.util.find_spec("uvloop") else {}
 
 
 @pytest.fixture(scope="function")
@@ -20,9 +31,10 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture(scope="function")
-def test_settings(temp_dir: Path) -> Settings:
+@pytest.fixture(scope="module")
+def test_settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
     """Create test settings."""
+    temp_dir = tmp_path_factory.mktemp("settings")
     return Settings(
         workdir=temp_dir,
         adr_dir=temp_dir / "ADR",
@@ -34,41 +46,99 @@ def test_settings(temp_dir: Path) -> Settings:
     )
 
 
-@pytest.fixture(scope="function")
-def test_db(test_settings: Settings) -> Generator[Session, None, None]:
-    """Create test database."""
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    """Create one in-memory database, with its schema, for the whole test session."""
     engine = create_engine(
-        test_settings.database_url, connect_args={"check_same_thread": False}
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
-    Base.metadata.create_all(bind=engine)
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
     
-    db = TestingSessionLocal()
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    # The in-memory database disappears with its connection; no need to drop tables
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(engine: Engine) -> Generator[Session, None, None]:
+    """Create a test session whose changes are rolled back after each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Session commits release SAVEPOINTs; the outer transaction is never committed
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def client(test_settings: Settings, test_db: Session) -> TestClient:
-    """Create test client."""
+def test_user(test_db: Session) -> User:
+    """Create a test user."""
+    user = User(email="test@example.com")
+    test_db.add(user)
+    test_db.flush()
+    return user
+
+
+@pytest.fixture(scope="function")
+def test_project(test_db: Session, test_user: User, temp_dir: Path) -> Project:
+    """Create a test project with ADR directories."""
+    adr_path = temp_dir / "ADR"
+    draft_path = adr_path / "Draft"
+    draft_path.mkdir(parents=True)
+    
+    project = Project(
+        name="Test Project",
+        slug="test-project",
+        root_path=str(temp_dir),
+        adr_path=str(adr_path),
+        draft_path=str(draft_path),
+        project_secret="test-secret",
+        owner_id=test_user.id,
+    )
+    test_db.add(project)
+    test_db.flush()
+    return project
+
+
+@pytest.fixture(scope="module")
+def app_client(test_settings: Settings) -> Generator[TestClient, None, None]:
+    """Create a test client whose app lifespan runs once per module."""
     
     def override_get_settings():
         return test_settings
     
     def override_get_db():
         try:
-            yield test_db
+            yield _client_db
         finally:
             pass
     
     app.dependency_overrides[get_settings] = override_get_settings
     app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as c:
+    with TestClient(app, backend_options=_CLIENT_BACKEND_OPTIONS) as c:
         yield c
     
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def client(app_client: TestClient, test_db: Session) -> Generator[TestClient, None, None]:
+    """Get the shared test client, serving this test's rolled-back session."""
+    global _client_db
+    _client_db = test_db
+    yield app_client
+    _client_db = None
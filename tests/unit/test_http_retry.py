@@ -0,0 +1,66 @@
+"""Tests for HTTP retry helper."""
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.services import http_retry
+from app.services.http_retry import retry_delay, send_with_retry
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_honors_retry_after(monkeypatch):
+    """Test 503 responses are retried after the Retry-After delay."""
+    sleeps = []
+    
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+    
+    monkeypatch.setattr(http_retry.asyncio, "sleep", fake_sleep)
+    responses = iter([httpx.Response(503, headers={"Retry-After": "2"}), httpx.Response(200)])
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses))) as client:
+        response = await send_with_retry(client, client.build_request("GET", "http://llm.test/"))
+    
+    assert response.status_code == 200
+    assert sleeps == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_gives_up(monkeypatch):
+    """Test the last retryable response is returned once attempts run out."""
+    async def fake_sleep(delay: float) -> None:
+        pass
+    
+    monkeypatch.setattr(http_retry.asyncio, "sleep", fake_sleep)
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        request = client.build_request("GET", "http://llm.test/")
+        response = await send_with_retry(client, request, max_attempts=3)
+    
+    assert response.status_code == 429
+    assert len(calls) == 3
+
+
+def test_retry_delay_backs_off_without_header():
+    """Test the delay grows exponentially and is capped."""
+    response = httpx.Response(503)
+    
+    assert 1.0 <= retry_delay(response, 1) < 2.0
+    assert 4.0 <= retry_delay(response, 3) < 5.0
+    assert retry_delay(response, 10) == http_retry.MAX_DELAY
+
+
+@pytest.mark.parametrize("zone", ["GMT", "-0000"])
+def test_retry_delay_parses_http_date(zone: str):
+    """Test Retry-After dates are honored, including naive "-0000" ones."""
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=10), usegmt=True)
+    response = httpx.Response(503, headers={"Retry-After": retry_at.replace("GMT", zone)})
+    
+    assert 8.0 <= retry_delay(response, 1) <= 10.0
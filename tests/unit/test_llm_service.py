@@ -0,0 +1,161 @@
+"""Tests for LLM compilation service."""
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.base import CompilationJob, Project, User
+from app.services import llm_service
+from app.services.llm_service import LLMService, start_compilation_background
+
+
+def create_job(test_db: Session, test_project: Project, test_user: User, draft: Path) -> str:
+    """Create a queued compilation job for ``draft``."""
+    job = CompilationJob(
+        job_id="job-1",
+        project_id=test_project.id,
+        user_id=test_user.id,
+        draft_path=str(draft),
+        status="queued",
+        logs=["Job created"],
+    )
+    test_db.add(job)
+    test_db.commit()
+    return job.job_id
+
+
+@pytest.mark.asyncio
+async def test_compile_adr_writes_improved_draft(
+    test_db: Session, test_project: Project, test_user: User
+):
+    """Test a successful compilation rewrites the draft and completes the job."""
+    draft = Path(test_project.draft_path) / "001-test.md"
+    draft.write_text("# 1. Test\n")
+    job_id = create_job(test_db, test_project, test_user, draft)
+    
+    service = LLMService(test_db)
+    with patch.object(service, "_call_llm", AsyncMock(return_value="# 1. Improved\n")):
+        await service.compile_adr(job_id)
+    
+    test_db.expire_all()
+    job = test_db.query(CompilationJob).filter_by(job_id=job_id).one()
+    assert job.status == "completed"
+    assert job.output_path == str(draft)
+    assert job.logs == [
+        "Job created",
+        "Starting compilation...",
+        "Sending to LLM...",
+        "LLM processing complete",
+        "Draft updated successfully",
+    ]
+    assert draft.read_text() == "# 1. Improved\n"
+
+
+@pytest.mark.asyncio
+async def test_compile_adr_keeps_database_io_off_event_loop(
+    test_db: Session, test_project: Project, test_user: User
+):
+    """Test every statement issued during compilation runs in a worker thread."""
+    draft = Path(test_project.draft_path) / "001-test.md"
+    draft.write_text("# 1. Test\n")
+    job_id = create_job(test_db, test_project, test_user, draft)
+    test_db.expire_all()
+    
+    threads = []
+    
+    def record_thread(conn, cursor, statement, parameters, context, executemany):
+        threads.append(threading.current_thread())
+    
+    engine = test_db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record_thread)
+    try:
+        service = LLMService(test_db)
+        with patch.object(service, "_call_llm", AsyncMock(return_value="# 1. Improved\n")):
+            await service.compile_adr(job_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_thread)
+    
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_compile_adr_missing_draft_fails_job(
+    test_db: Session, test_project: Project, test_user: User
+):
+    """Test a missing draft marks the job as failed."""
+    draft = Path(test_project.draft_path) / "404-missing.md"
+    job_id = create_job(test_db, test_project, test_user, draft)
+    
+    service = LLMService(test_db)
+    await service.compile_adr(job_id)
+    
+    job = test_db.query(CompilationJob).filter_by(job_id=job_id).one()
+    assert job.status == "failed"
+    assert "Draft not found" in job.error_message
+
+
+@pytest.mark.asyncio
+async def test_start_compilation_background_keeps_task_reference():
+    """Test background compilations are tracked until they finish."""
+    with patch.object(LLMService, "compile_adr", AsyncMock()) as compile_adr:
+        task = start_compilation_background(object(), "job-1")
+        assert task in llm_service._background_tasks
+        
+        await task
+        await asyncio.sleep(0)
+    
+    compile_adr.assert_awaited_once_with("job-1")
+    assert task not in llm_service._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_call_llm_skips_endpoints_with_open_circuit(test_db: Session, monkeypatch):
+    """Test failing endpoints are skipped once their circuit opens."""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+    
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "_breakers", {})
+    monkeypatch.setattr(llm_service, "_get_http_client", lambda: client)
+    service = LLMService(test_db)
+    
+    for _ in range(llm_service._BREAKER_FAILURE_THRESHOLD):
+        await service._call_llm("# Draft")
+    assert len(requests) == 2 * llm_service._BREAKER_FAILURE_THRESHOLD
+    
+    result = await service._call_llm("# Draft")
+    
+    assert len(requests) == 2 * llm_service._BREAKER_FAILURE_THRESHOLD
+    assert "LLM enhancement unavailable" in result
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_call_llm_accepts_non_streaming_openai_response(test_db: Session, monkeypatch):
+    """Test a plain JSON chat completion is used when the server ignores streaming."""
+    service = LLMService(test_db)
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) != service.openai_endpoint:
+            return httpx.Response(404)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"role": "assistant", "content": "# Improved"}}]}
+        )
+    
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "_breakers", {})
+    monkeypatch.setattr(llm_service, "_get_http_client", lambda: client)
+    
+    result = await service._call_llm("# Draft")
+    
+    assert result == "# Improved"
+    await client.aclose()
@@ -0,0 +1,90 @@
+"""Tests for MCP client."""
+import httpx
+import pytest
+
+from app.services.mcp_client import MCPClient
+
+
+def make_client(handler) -> MCPClient:
+    """Create an MCP client whose requests are served by ``handler``."""
+    client = MCPClient()
+    client.base_url = "http://mcp.test/api"
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_projects_cached_within_ttl():
+    """Test repeated project listings within the TTL skip the network."""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"projects": [{"id": "p1", "name": "Project 1"}]})
+    
+    client = make_client(handler)
+    
+    first = await client.get_projects()
+    second = await client.get_projects()
+    
+    assert [p.id for p in first] == ["p1"]
+    assert second == first
+    assert len(requests) == 1
+    assert requests[0].url == "http://mcp.test/api/projects"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_features_revalidates_with_etag():
+    """Test expired listings are revalidated and reused on 304."""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={"features": [{"id": "f1", "project_id": "p1", "name": "Feature 1"}]},
+            headers={"ETag": '"v1"'},
+        )
+    
+    client = make_client(handler)
+    client.cache_ttl = 0
+    
+    first = await client.get_features("p1")
+    second = await client.get_features("p1")
+    
+    assert [f.id for f in second] == ["f1"]
+    assert second == first
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert requests[1].url.params["project"] == "p1"
+    
+    client.invalidate()
+    await client.get_features("p1")
+    assert "If-None-Match" not in requests[2].headers
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_features_for_projects():
+    """Test features are fetched for each requested project."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.params["project"]
+        return httpx.Response(
+            200,
+            json={"features": [{"id": f"{project_id}-f1", "project_id": project_id, "name": "F"}]},
+        )
+    
+    client = make_client(handler)
+    
+    features = await client.get_features_for_projects(["p1", "p2"])
+    
+    assert {pid: [f.id for f in items] for pid, items in features.items()} == {
+        "p1": ["p1-f1"],
+        "p2": ["p2-f1"],
+    }
+    await client.aclose()